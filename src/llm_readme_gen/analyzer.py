@@ -1,17 +1,48 @@
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from collections import Counter
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set
+import heapq
+import os
 import re
+import sys
 
-EXT_LANG_MAP = {
+# language names are interned so Counter keys compare by identity in the hot loop
+EXT_LANG_MAP = {k: sys.intern(v) for k, v in {
     ".py": "Python", ".js": "JavaScript", ".ts": "TypeScript",
     ".java": "Java", ".go": "Go", ".rs": "Rust", ".cpp": "C++", ".c": "C",
     ".cs": "C#", ".rb": "Ruby", ".php": "PHP", ".swift": "Swift"
+}.items()}
+
+_TEST_RE = re.compile(r"(?:^test_|_test\.)")
+_TEST_DIR_RE = re.compile(r"^test", re.IGNORECASE)
+_DESC_RE = re.compile(r'description\s*=\s*"(.*?)"')
+
+# Lower-cased license markers. They are compiled into one alternation so the header is scanned
+# once; the leftmost marker wins, which is the license title in the usual layout.
+_LICENSE_MARKERS = {
+    b"gnu affero general public license": "AGPL",
+    b"gnu lesser general public license": "LGPL",
+    b"gnu library general public license": "LGPL",
+    b"gnu general public license": "GPL",
+    b"mozilla public license": "MPL",
+    b"apache license": "Apache",
+    b"mit license": "MIT",
+    b"permission is hereby granted, free of charge": "MIT",
+    b"redistribution and use in source and binary forms": "BSD",
+    b"bsd": "BSD",
+    b"this is free and unencumbered software released into the public domain": "Unlicense",
+    b"cc0": "CC0",
+    b"apache": "Apache",
+    b"agpl": "AGPL",
+    b"lgpl": "LGPL",
+    b"gpl": "GPL",
 }
+_LICENSE_RE = re.compile(b"|".join(re.escape(m) for m in _LICENSE_MARKERS))
 
 
-@dataclass
+@dataclass(frozen=True)
 class RepoMetadata:
     name: str
     description: Optional[str]
@@ -22,6 +53,26 @@ class RepoMetadata:
     license: Optional[str]
     readme_exists: bool
 
+    # Prompt fragments derived from the (immutable) metadata, computed once per instance.
+
+    @cached_property
+    def languages_str(self) -> str:
+        return ", ".join(self.languages) or "unknown"
+
+    @cached_property
+    def top_files_str(self) -> str:
+        return ", ".join(self.top_files[:10])
+
+
+class _Entry(NamedTuple):
+    relpath: str
+    name: str
+    suffix: str  # lower-cased, e.g. ".py"
+    size: int
+    # both follow symlinks, like Path.is_dir()/is_file(); dangling links and special files are neither
+    is_dir: bool
+    is_file: bool
+
 
 class RepoAnalyzer:
     def __init__(self, repo_path: Path):
@@ -30,12 +81,16 @@ class RepoAnalyzer:
     def analyze(self) -> RepoMetadata:
         name = self.repo_path.name
         description = self._extract_description()
-        languages = self._detect_languages()
-        top_files = self._top_files()
-        has_tests = self._detect_tests()
-        dependencies = self._detect_dependencies()
+        # walk the tree once and share the entries between the detectors
+        entries = list(self._walk_once())
+        languages = self._detect_languages(entries)
+        top_files = self._top_files(entries)
+        has_tests = self._detect_tests(entries)
+        # top-level names come from the same walk instead of one exists() stat per candidate file
+        root_names = {e.name for e in entries if e.relpath == e.name and (e.is_file or e.is_dir)}
+        dependencies = self._detect_dependencies(root_names)
         license_name = self._detect_license()
-        readme_exists = (self.repo_path / "README.md").exists() or (self.repo_path / "README.rst").exists()
+        readme_exists = "README.md" in root_names or "README.rst" in root_names
         return RepoMetadata(
             name=name,
             description=description,
@@ -47,58 +102,82 @@ class RepoAnalyzer:
             readme_exists=readme_exists
         )
 
-    def _all_files(self):
-        for p in self.repo_path.rglob("*"):
-            if p.is_file():
-                yield p
-
-    def _detect_languages(self) -> Dict[str, int]:
-        counter = Counter()
-        for p in self._all_files():
-            ext = p.suffix.lower()
-            if ext in EXT_LANG_MAP:
-                counter[EXT_LANG_MAP[ext]] += 1
+    def _walk_once(self) -> Iterator[_Entry]:
+        # os.scandir answers is_dir()/stat() from the directory listing where the OS allows it,
+        # so each entry costs at most one syscall instead of the several Path.rglob + stat needs.
+        # relative paths are built by string concatenation, avoiding a relpath/PurePath per entry
+        stack = [(str(self.repo_path), "")]
+        while stack:
+            directory, rel_prefix = stack.pop()
+            try:
+                it = os.scandir(directory)
+            except PermissionError:
+                if not rel_prefix:
+                    raise
+                continue  # unreadable subdirectory: skipped, as Path.rglob did
+            with it:
+                for entry in it:
+                    relpath = rel_prefix + entry.name
+                    is_dir = entry.is_dir()
+                    is_file = not is_dir and entry.is_file()
+                    # only file sizes are ranked, so don't spend a stat on anything else;
+                    # DirEntry caches the file stat so it is fetched at most once
+                    size = entry.stat().st_size if is_file else 0
+                    suffix = os.path.splitext(entry.name)[1].lower()
+                    yield _Entry(relpath, entry.name, suffix, size, is_dir, is_file)
+                    # symlinked directories are listed but not descended into
+                    if is_dir and not entry.is_symlink():
+                        stack.append((entry.path, relpath + os.sep))
+
+    def _detect_languages(self, entries: List[_Entry]) -> Dict[str, int]:
+        # map/filter feed Counter's C counting loop instead of a Python-level += per file
+        suffixes = (e.suffix for e in entries if e.is_file)
+        counter = Counter(filter(None, map(EXT_LANG_MAP.get, suffixes)))
+        # most-used language first: the template and prompts list languages in this order.
+        # Sorted once per analysis; the prompt strings built from it are cached on RepoMetadata.
         return dict(counter.most_common())
 
-    def _top_files(self, n=10) -> List[str]:
-        files = [p for p in self._all_files()]
-        files.sort(key=lambda p: p.stat().st_size, reverse=True)
-        return [str(p.relative_to(self.repo_path)) for p in files[:n]]
+    def _top_files(self, entries: List[_Entry], n=10) -> List[str]:
+        # only n items are needed, so keep a bounded heap instead of sorting every file
+        files = (e for e in entries if e.is_file)
+        return [e.relpath for e in heapq.nlargest(n, files, key=lambda e: e.size)]
 
-    def _detect_tests(self) -> bool:
+    def _detect_tests(self, entries: Optional[Iterable[_Entry]] = None) -> bool:
         # Simple heuristics: presence of tests/ directory or files named test_*.py or *_test.go etc.
-        for p in self.repo_path.rglob("*"):
-            if p.is_dir() and p.name.lower().startswith("test"):
-                return True
-            if p.is_file() and re.search(r"(?:^test_|_test\.)", p.name):
-                return True
-        return False
-
-    def _detect_dependencies(self) -> Dict[str, List[str]]:
+        # The common layout is answered by a single stat before looking at any entry.
+        if (self.repo_path / "tests").is_dir():
+            return True
+        if entries is None:
+            # called on its own: walk lazily so the scan stops at the first hit
+            entries = self._walk_once()
+        # one precompiled match per entry; directories and files use different patterns
+        return any(
+            (e.is_dir and _TEST_DIR_RE.search(e.name)) or (e.is_file and _TEST_RE.search(e.name))
+            for e in entries
+        )
+
+    def _detect_dependencies(self, root_names: Optional[Set[str]] = None) -> Dict[str, List[str]]:
+        if root_names is None:
+            root_names = set(os.listdir(self.repo_path))
         deps = {}
-        py_req = self.repo_path / "requirements.txt"
-        py_proj = self.repo_path / "pyproject.toml"
-        pkg_json = self.repo_path / "package.json"
-        if py_req.exists():
+        if "requirements.txt" in root_names:
             deps.setdefault("python", []).append("requirements.txt")
-        if py_proj.exists():
+        if "pyproject.toml" in root_names:
             deps.setdefault("python", []).append("pyproject.toml")
-        if pkg_json.exists():
+        if "package.json" in root_names:
             deps.setdefault("node", []).append("package.json")
         return deps
 
     def _detect_license(self) -> Optional[str]:
-        # read top level LICENSE or LICENSE.* first 1KB to try find type
+        # read top level LICENSE or LICENSE.* first 2KB to try find type
         for lic in self.repo_path.glob("LICENSE*"):
             try:
-                text = lic.read_text(encoding="utf8", errors="ignore")[:2000].lower()
-                if "mit license" in text or "mit" in text:
-                    return "MIT"
-                if "apache" in text:
-                    return "Apache"
-                if "gpl" in text:
-                    return "GPL"
-                return lic.name
+                # bounded binary read: no need to decode a 35KB GPL text to sniff its header
+                with open(lic, "rb") as f:
+                    head = f.read(2048).lower()
+                # no bare b"mit" marker: it would also match "permitted", "submit", "commitment", ...
+                m = _LICENSE_RE.search(head)
+                return _LICENSE_MARKERS[m.group(0)] if m else lic.name
             except Exception:
                 return lic.name
         return None
@@ -107,19 +186,21 @@ class RepoAnalyzer:
         # heuristics: read existing README short first paragraph or pyproject description
         readme_paths = [self.repo_path / "README.md", self.repo_path / "README.rst"]
         for p in readme_paths:
-            if p.exists():
-                text = p.read_text(errors="ignore")
-                # first non-empty paragraph
-                for part in text.split("\n\n"):
-                    s = part.strip()
-                    if s:
-                        # return first line or trimmed paragraph
-                        return s.splitlines()[0].strip()
+            try:
+                with open(p, "rb") as f:
+                    head = f.read(16384)
+            except OSError:
+                continue
+            # first non-empty line that is not a Markdown heading; stop at the first hit
+            for line in head.splitlines():
+                s = line.strip()
+                if s and not s.startswith(b"#"):
+                    return s.decode("utf8", "ignore")
         # fallback: pyproject.toml description
         pyproj = self.repo_path / "pyproject.toml"
         if pyproj.exists():
             content = pyproj.read_text(errors="ignore")
-            m = re.search(r'description\s*=\s*"(.*?)"', content)
+            m = _DESC_RE.search(content)
             if m:
                 return m.group(1)
         return None
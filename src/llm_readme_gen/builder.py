@@ -1,16 +1,71 @@
+import json
+import re
 from pathlib import Path
 from .analyzer import RepoMetadata
 from .template_engine import TemplateEngine
 from .llm_client import LLMClient, NoopLLMClient
-from typing import Optional
+from typing import Optional, Tuple
 from .config import Config
 
+# (language, has requirements.txt) -> usage hint; languages are checked in priority order
+_USAGE_LANG_PRIORITY = ("Python", "JavaScript", "TypeScript")
+_USAGE_HINTS = {
+    ("Python", True): "pip install -r requirements.txt\npython -m <package>",
+    ("Python", False): "python -m <package> or python main.py",
+    ("JavaScript", False): "npm install\nnpm start",
+    ("TypeScript", False): "npm install\nnpm start",
+}
+
+# Prompt templates, parsed once at import; bound .format methods are called with the fields.
+# Static instructions come first and must stay byte-identical between calls (no repo data, no
+# timestamps): providers cache shared prompt prefixes, so only the repository facts at the end
+# are processed anew. Never interpolate variable data into _FULL_README_INSTRUCTIONS.
+_FULL_README_INSTRUCTIONS = """
+    You are a helpful assistant. Write a complete, factual README for the repository described below.
+
+    Include sections:
+    - Project Overview
+    - Installation Instructions (use detected dependencies)
+    - Usage Guide (include example commands based on main files)
+    - Project Structure (list top files/directories)
+    - Testing Instructions
+    - License Information
+
+    Make the instructions accurate and specific to the repository. Avoid generic placeholders like 'repo' or 'python -m <package>'.
+    """
+
+_REPO_FACTS = """
+    Repository Name: {name}
+    Repository URL: {repo_url}
+    Short Description: {description}
+    Languages: {languages}
+    Top Files: {top_files}
+    Dependencies: {dependencies}
+    Tests Included: {has_tests}
+    License: {license}
+    """.format
+
+_COMBINED_SYSTEM_PROMPT = _FULL_README_INSTRUCTIONS + """
+    Respond with a single JSON object and nothing else, with exactly two keys:
+    "description": a one or two sentence summary of the project,
+    "readme": the complete README in Markdown.
+    """
+
+# start of a JSON string value, for salvaging fields from an envelope cut off by max_tokens
+_FIELD_START_RES = {key: re.compile(r'"%s"\s*:\s*"' % key) for key in ("description", "readme")}
+# an escape sequence cut off at the end of a truncated string: an odd run of backslashes, a
+# partial \uXX, or a high-surrogate \uD8XX whose low half (itself possibly partial) is missing
+_CUT_ESCAPE_RE = re.compile(
+    r'(?<!\\)((?:\\\\)*)\\(?:u[dD][89abAB][0-9a-fA-F]{2}(?:\\(?:u[0-9a-fA-F]{0,3})?)?|u[0-9a-fA-F]{0,3})?$'
+)
+
 
 class ReadmeBuilder:
     def __init__(self, cfg: Config, llm: Optional[LLMClient] = None, template_dir: Path = Path("templates")):
         self.cfg = cfg
         self.llm = llm or NoopLLMClient()
         self.template_engine = TemplateEngine(template_dir)
+        self._llm_result = None  # (metadata, (description, readme)) of the last LLM call
 
     def build_context(self, metadata: RepoMetadata) -> dict:
         """
@@ -20,10 +75,9 @@ class ReadmeBuilder:
         description = metadata.description or ""
 
         if self.cfg.use_llm:
-            # Compose full README prompt instead of just short description
-            prompt = self._compose_full_readme_prompt(metadata, self.cfg.repo_url)
+            # Description comes from the same LLM call that writes the full README
             try:
-                description = self.llm.generate(prompt, max_tokens=1500, temperature=0.2)
+                description, _ = self._generate_with_llm(metadata)
             except Exception:
                 # fallback
                 description = metadata.description or ""
@@ -44,101 +98,118 @@ class ReadmeBuilder:
 
         return context
 
-    def _compose_prompt_for_description(self, metadata: RepoMetadata) -> str:
+    def _compose_repo_facts(self, metadata: RepoMetadata, repo_url: str) -> str:
+        return _REPO_FACTS(
+            name=metadata.name,
+            repo_url=repo_url,
+            description=metadata.description or 'No description provided',
+            languages=metadata.languages_str,
+            top_files=metadata.top_files_str,
+            dependencies=metadata.dependencies or 'None detected',
+            has_tests='Yes' if metadata.has_tests else 'No',
+            license=metadata.license or 'Unspecified',
+        )
+
+    def _generate_with_llm(self, metadata: RepoMetadata) -> Tuple[str, Optional[str]]:
         """
-        Build a detailed prompt for the LLM so it writes an accurate README.
+        Return (description, readme) from a single LLM round-trip, reused for the same metadata.
+        readme is None when the answer held no usable README and the template should be used.
         """
-        # Show top files (just 10) and include relative paths
-        top_files = "\n".join(f"- {f}" for f in metadata.top_files[:10])
-
-        # Show dependencies by language
-        dependencies = "\n".join(
-            f"- {lang}: {', '.join(pkgs)}" for lang, pkgs in (metadata.dependencies or {}).items()
-        ) or "None"
-
-        # Include first paragraph from existing README if exists
-        readme_excerpt = ""
-        readme_paths = [self.cfg.work_dir / "README.md", self.cfg.work_dir / "README.rst"]
-        for p in readme_paths:
-            if p.exists():
-                readme_excerpt = "\n".join(p.read_text(errors="ignore").splitlines()[:10])
-                break
-
-        prompt = f"""
-    You are a helpful assistant generating a README.md for a GitHub repository.
-    Use ONLY the information provided. Do NOT make up commands, repo names, or URLs.
-
-    Repository name: {metadata.name}
-    Short description: {metadata.description or 'N/A'}
-    Languages used: {', '.join(metadata.languages.keys()) or 'unknown'}
-    Top files (from repo root):
-    {top_files}
-    Dependencies:
-    {dependencies}
-    First few lines of existing README (if any):
-    {readme_excerpt or 'None'}
-
-    Write a README that includes:
-
-    1. Correct project title
-    2. Description (summarize functionality based on files and description)
-    3. Installation instructions (based on detected dependencies)
-    4. Usage instructions (based on detected main files)
-    5. Project structure (list top files)
-    6. Tests (if detected)
-    7. License (if available)
-
-    Do not fabricate any information. Use proper Markdown formatting.
-    """
-        return prompt
-    
-    def _compose_full_readme_prompt(self, metadata: RepoMetadata, repo_url: str) -> str:
+        if self._llm_result is not None and self._llm_result[0] is metadata:
+            return self._llm_result[1]
+        # static instructions go in the system message, repository facts in the user message
+        prompt = self._compose_repo_facts(metadata, repo_url=self.cfg.repo_address)
+        kwargs = {"max_tokens": 1700, "system_prompt": _COMBINED_SYSTEM_PROMPT}
+        raw = self.llm.generate(prompt, **kwargs)
+        parsed = self._parse_combined_response(raw)
+        if parsed is None:
+            # do not let a cache layer replay an answer that failed to parse
+            self.llm.forget(prompt, **kwargs)
+            parsed = self._salvage_response(raw)
+        description, readme = parsed
+        result = (description or metadata.description or "", readme)
+        self._llm_result = (metadata, result)
+        return result
+
+    @staticmethod
+    def _strip_fence(raw: str) -> str:
+        text = raw.strip()
+        # models often wrap JSON in a ```json fence
+        if text.startswith("```"):
+            text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+        return text.strip()
+
+    @classmethod
+    def _parse_combined_response(cls, raw: str) -> Optional[Tuple[Optional[str], str]]:
         """
-        Generate a detailed prompt for the full README using repo metadata.
+        (description, readme) from a well-formed JSON answer, None for anything else.
         """
-        prompt = f"""
-    You are a helpful assistant. Write a complete, factual README for the repository.
-
-    Repository Name: {metadata.name}
-    Repository URL: {repo_url}
-    Short Description: {metadata.description or 'No description provided'}
-    Languages: {', '.join(metadata.languages.keys()) or 'unknown'}
-    Top Files: {', '.join(metadata.top_files[:10])}
-    Dependencies: {metadata.dependencies or 'None detected'}
-    Tests Included: {'Yes' if metadata.has_tests else 'No'}
-    License: {metadata.license or 'Unspecified'}
-
-    Include sections:
-    - Project Overview
-    - Installation Instructions (use detected dependencies)
-    - Usage Guide (include example commands based on main files)
-    - Project Structure (list top files/directories)
-    - Testing Instructions
-    - License Information
+        try:
+            data = json.loads(cls._strip_fence(raw))
+        except ValueError:
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("readme"), str):
+            return None
+        description = data.get("description")
+        return (description if isinstance(description, str) else None), data["readme"]
+
+    @classmethod
+    def _salvage_response(cls, raw: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Best effort for an answer that is not a well-formed envelope: recover the fields from a
+        truncated one, take plain Markdown as the README, and give up (None) on other JSON.
+        """
+        text = cls._strip_fence(raw)
+        if not text.startswith("{"):
+            return None, raw
+        return cls._partial_field(text, "description"), cls._partial_field(text, "readme") or None
 
-    Make the instructions accurate and specific to the repository. Avoid generic placeholders like 'repo' or 'python -m <package>'.
-    """
-        return prompt
+    @staticmethod
+    def _partial_field(text: str, key: str) -> Optional[str]:
+        """
+        Decode the string value of key, up to where the text stops if the string is unterminated.
+        """
+        m = _FIELD_START_RES[key].search(text)
+        if m is None:
+            return None
+        try:
+            return json.decoder.scanstring(text, m.end(), False)[0]
+        except ValueError:
+            pass
+        # keep the complete escaped backslashes before the cut-off sequence, drop the rest
+        rest = _CUT_ESCAPE_RE.sub(r"\1", text[m.end():])
+        try:
+            return json.decoder.scanstring(rest + '"', 0, False)[0]
+        except ValueError:
+            return None
 
     def _generate_usage_hint(self, metadata: RepoMetadata) -> str:
         # heuristic usage hints
-        if "Python" in metadata.languages:
-            if "requirements.txt" in (metadata.dependencies.get("python") or []):
-                return "pip install -r requirements.txt\npython -m <package>"
-            return "python -m <package> or python main.py"
-        if "JavaScript" in metadata.languages or "TypeScript" in metadata.languages:
-            return "npm install\nnpm start"
-        return "See project files for usage instructions."
-
-    def render(self, metadata: RepoMetadata, output_path: Path):
+        lang = next((l for l in _USAGE_LANG_PRIORITY if l in metadata.languages), None)
+        has_requirements = lang == "Python" and "requirements.txt" in (metadata.dependencies.get("python") or [])
+        return _USAGE_HINTS.get((lang, has_requirements), "See project files for usage instructions.")
+
+    def render(self, metadata: RepoMetadata, output_path: Path, preview_chars: int = 1000) -> str:
+        """
+        Write the README to output_path and return its first preview_chars characters.
+        """
     # If LLM is enabled, generate the entire README
+        content = None
         if self.cfg.use_llm:
-            prompt = self._compose_full_readme_prompt(metadata, repo_url=self.cfg.repo_address)
-            content = self.llm.generate(prompt, max_tokens=1500)
+            _, content = self._generate_with_llm(metadata)
+        if content is not None:
+            chunks = [content]
         else:
-            # Fallback: use template-based generation
+            # Fallback: use template-based generation, streamed to disk chunk by chunk
             ctx = self.build_context(metadata)
-            content = self.template_engine.render("readme.md.jinja", ctx)
-
-        output_path.write_text(content, encoding="utf8")
-        return content
\ No newline at end of file
+            chunks = self.template_engine.stream("readme.md.jinja", ctx)
+
+        head = []
+        head_len = 0
+        with open(output_path, "w", encoding="utf8") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                if head_len < preview_chars:
+                    head.append(chunk)
+                    head_len += len(chunk)
+        return "".join(head)[:preview_chars]
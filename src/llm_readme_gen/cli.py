@@ -1,10 +1,11 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from .config import Config
 from .repo_fetcher import RepoFetcher
 from .analyzer import RepoAnalyzer
 from .builder import ReadmeBuilder
-from .llm_client import NoopLLMClient, OpenAIClient, DeepSeekClient
+from .llm_client import CACHE_DIR_NAME, CachedLLMClient, DiskCacheBackend, MemoizingLLMClient, NoopLLMClient, SemanticCachedLLMClient, OpenAIClient, DeepSeekClient
 import os
 
 
@@ -16,15 +17,18 @@ def main(argv=None):
     parser.add_argument("--use-llm", action="store_true", help="use configured LLM to enhance text")
     parser.add_argument("--provider", choices=["openai", "deepseek"], default=None)
     parser.add_argument("--model", default=None, help="LLM model to use (e.g., deepseek-chat or OpenAI model)")
+    parser.add_argument("--read-only", action="store_true", help="analyze a local repository in place instead of copying it")
+    parser.add_argument("--serial-copy", action="store_true", help="copy a local repository file by file on one thread")
+    parser.add_argument("--no-llm-cache", action="store_true", help="always call the LLM instead of reusing cached responses")
+    parser.add_argument("--semantic-cache", action="store_true", help="also reuse answers to near-identical prompts (needs sentence-transformers)")
     args = parser.parse_args(argv)
 
-    cfg = Config(repo_address=args.repo, output_path=Path(args.out), work_dir=Path(args.work_dir), use_llm=args.use_llm, llm_provider=args.provider, llm_model=args.model,)
+    cfg = Config(repo_address=args.repo, output_path=Path(args.out), work_dir=Path(args.work_dir), use_llm=args.use_llm, llm_provider=args.provider, llm_model=args.model, read_only=args.read_only, fast_copy=not args.serial_copy)
 
     fetcher = RepoFetcher(cfg)
     repo_root = fetcher.fetch()
 
     analyzer = RepoAnalyzer(repo_root)
-    metadata = analyzer.analyze()
 
     llm = None
     if cfg.use_llm:
@@ -42,9 +46,23 @@ def main(argv=None):
             llm = OpenAIClient(api_key=key)
         else:
             llm = NoopLLMClient()
+        if not args.no_llm_cache and not isinstance(llm, NoopLLMClient):
+            cache_dir = cfg.work_dir / CACHE_DIR_NAME
+            if args.semantic_cache:
+                llm = SemanticCachedLLMClient(llm, cache_dir)
+            # exact matches are checked first, so they never pay for an embedding
+            llm = CachedLLMClient(llm, DiskCacheBackend(cache_dir))
+            # repeated prompts within this run skip hashing and the disk entirely
+            llm = MemoizingLLMClient(llm)
     else:
         llm = NoopLLMClient()
 
+    # The walk is disk-bound and the warmup network-bound: overlap them, without ever waiting
+    # on the warmup (short and unretried, so harmless when a cache ends up answering).
+    pool = ThreadPoolExecutor(max_workers=1)
+    pool.submit(llm.warmup)  # errors are dropped: the real request will report them
+    metadata = analyzer.analyze()
+    pool.shutdown(wait=False)
 
     builder = ReadmeBuilder(cfg, llm=llm, template_dir=Path(__file__).parent.parent.parent / "templates")
     content = builder.render(metadata, cfg.output_path)
@@ -1,26 +1,27 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-@dataclass
+DEFAULT_LLM_BASE_URL = "https://openrouter.ai/api/v1"
+
+
+@dataclass(frozen=True)
 class Config:
-    def __init__(
-        self,
-        repo_address: str,
-        output_path: Path,
-        work_dir: Path,
-        use_llm: bool,
-        llm_provider: Optional[str] = None,
-        llm_model: Optional[str] = None,
-        llm_base_url: Optional[str] = None,   # <- Add this
-    ):
-        self.repo_address = repo_address
-        self.output_path = output_path
-        self.work_dir = work_dir
-        self.use_llm = use_llm
-        self.llm_provider = llm_provider
-        self.llm_model = llm_model
-        self.llm_base_url = llm_base_url or "https://openrouter.ai/api/v1"  # default
+    repo_address: str
+    output_path: Path
+    work_dir: Path
+    use_llm: bool
+    llm_provider: Optional[str] = None
+    llm_model: Optional[str] = None
+    llm_base_url: Optional[str] = DEFAULT_LLM_BASE_URL
+    read_only: bool = False  # analyze a local path in place instead of copying it
+    fast_copy: bool = True  # copy local paths with a thread pool
+    # derived from repo_address in __post_init__
+    repo_url: Optional[str] = field(init=False, default=None)
 
+    def __post_init__(self):
+        # frozen: derived fields are set through object.__setattr__
+        if not self.llm_base_url:
+            object.__setattr__(self, "llm_base_url", DEFAULT_LLM_BASE_URL)
         # Optional: detect repo URL automatically
-        self.repo_url = repo_address if repo_address.startswith("http") else None
+        object.__setattr__(self, "repo_url", self.repo_address if self.repo_address.startswith("http") else None)
@@ -1,4 +1,62 @@
+import asyncio
+from collections import OrderedDict
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError, ReadTimeoutError
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: several times faster than the stdlib on large LLM payloads
+except ImportError:
+    orjson = None
+
+# Sub-directory of the work dir holding cached LLM responses; kept across runs by RepoFetcher.
+CACHE_DIR_NAME = ".llm_cache"
+DEFAULT_CACHE_TTL = 24 * 3600.0  # seconds
+# Warmup is only an optimization: it gets one short attempt and is never retried.
+WARMUP_TIMEOUT = 2.0  # seconds
+# Callers can pass system_prompt= to generate(). Keep it static and put repository-specific text
+# in the prompt itself, so the shared prefix can be served from the provider's prompt cache.
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant."
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf8")
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _iter_sse_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Decoded lines of a server-sent event stream. Splits the raw bytes at LF (dropping a CR before
+    it) only: str.splitlines() would also break at U+2028, U+2029 and U+0085, which JSON payloads
+    may carry unescaped inside strings.
+    """
+    pending = b""
+    for chunk in chunks:
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            yield (line[:-1] if line.endswith(b"\r") else line).decode("utf-8")
+    if pending:
+        yield (pending[:-1] if pending.endswith(b"\r") else pending).decode("utf-8")
+
+
+class LLMTimeoutError(RuntimeError):
+    """
+    The provider did not accept the connection or send data within the configured timeout.
+    """
 
 
 class LLMClient:
@@ -9,35 +67,400 @@ class LLMClient:
     def generate(self, prompt: str, **kwargs) -> str:
         raise NotImplementedError
 
+    def warmup(self) -> None:
+        """
+        Optionally open the connection to the provider ahead of the first generate() call.
+        """
+
+    def forget(self, prompt: str, **kwargs) -> None:
+        """
+        Drop any cached answer for generate(prompt, **kwargs), e.g. one the caller could not use.
+        """
+
 
 class NoopLLMClient(LLMClient):
     def generate(self, prompt: str, **kwargs) -> str:
         # Just return the prompt or a short canned summary — useful for offline fallback.
-        return " ".join(prompt.splitlines())[:1000]  # naive fallback
+        # Joining shrinks the text by at most 2:1 (a "\r\n" becomes one space) and never grows it,
+        # so the first 1000 chars always come from a 2002-char head: no need to split the whole prompt.
+        return " ".join(prompt[:2002].splitlines())[:1000]  # naive fallback
+
+
+class CacheBackend(Protocol):
+    """
+    Storage for CachedLLMClient: get() returns None on a miss or an expired entry.
+    """
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class MemoryCacheBackend:
+    """
+    In-process cache; entries older than ttl seconds (None = never) are misses.
+    """
+
+    def __init__(self, ttl: Optional[float] = DEFAULT_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, str]] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if self.ttl is not None and time.time() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: str, value: str, stored_at: Optional[float] = None) -> None:
+        self._entries[key] = (time.time() if stored_at is None else stored_at, value)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+class DiskCacheBackend:
+    """
+    One file per entry under directory, persisted across runs. The file mtime is the entry's
+    timestamp; entries read or written by this process are also kept in memory.
+    """
+
+    def __init__(self, directory: Path, ttl: Optional[float] = DEFAULT_CACHE_TTL):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self._hot = MemoryCacheBackend(ttl)
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._hot.get(key)
+        if value is not None:
+            return value
+        path = self.directory / f"{key}.txt"
+        try:
+            stored_at = path.stat().st_mtime
+            if self.ttl is not None and time.time() - stored_at > self.ttl:
+                return None
+            value = path.read_text(encoding="utf8")
+        except FileNotFoundError:
+            return None
+        self._hot.set(key, value, stored_at)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.txt"
+        # write then rename so a concurrent reader never sees a partial entry
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(value, encoding="utf8")
+        os.replace(tmp, path)
+        self._hot.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self._hot.delete(key)
+        try:
+            (self.directory / f"{key}.txt").unlink()
+        except FileNotFoundError:
+            pass
+
+
+class _WrappingLLMClient(LLMClient):
+    """
+    Base for clients layered over another one: the model and warmup are the inner client's, so
+    cache keys built from self.model stay correct however the layers are stacked.
+    """
+
+    inner: LLMClient
+
+    @property
+    def model(self) -> str:
+        return getattr(self.inner, "model", type(self.inner).__name__)
+
+    def warmup(self) -> None:
+        self.inner.warmup()
+
+    def forget(self, prompt: str, **kwargs) -> None:
+        self.inner.forget(prompt, **kwargs)
+
+
+class CachedLLMClient(_WrappingLLMClient):
+    """
+    Wrap another client and serve repeated requests from a cache backend, keyed by a digest of
+    model, prompt and params.
+    """
+
+    def __init__(self, inner: LLMClient, backend: CacheBackend):
+        self.inner = inner
+        self.backend = backend
+
+    def _key(self, prompt: str, kwargs: dict) -> str:
+        payload = json.dumps({"model": self.model, "prompt": prompt, "kwargs": kwargs}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf8")).hexdigest()
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        key = self._key(prompt, kwargs)
+        text = self.backend.get(key)
+        if text is not None:
+            return text
+        # only successful responses reach the cache: errors propagate before set()
+        text = self.inner.generate(prompt, **kwargs)
+        self.backend.set(key, text)
+        return text
+
+    def forget(self, prompt: str, **kwargs) -> None:
+        self.backend.delete(self._key(prompt, kwargs))
+        self.inner.forget(prompt, **kwargs)
+
+
+class MemoizingLLMClient(_WrappingLLMClient):
+    """
+    Per-process LRU memo in front of another client: identical requests within one run are
+    answered from memory. Compose with CachedLLMClient for reuse across runs.
+    """
+
+    def __init__(self, inner: LLMClient, maxsize: int = 256):
+        self.inner = inner
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        key = (prompt, tuple(sorted(kwargs.items())))
+        try:
+            text = self._cache.get(key)
+        except TypeError:
+            # unhashable parameter values: not memoizable
+            key = text = None
+        if text is not None:
+            self._cache.move_to_end(key)
+            return text
+        text = self.inner.generate(prompt, **kwargs)
+        if key is not None:
+            self._cache[key] = text
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return text
+
+    def forget(self, prompt: str, **kwargs) -> None:
+        try:
+            self._cache.pop((prompt, tuple(sorted(kwargs.items()))), None)
+        except TypeError:
+            pass
+        self.inner.forget(prompt, **kwargs)
+
+
+# Lines identifying the repository in the builder's prompt; semantic matches never cross them.
+_REPO_SCOPE_RE = re.compile(r"^[ \t]*Repository (?:Name|URL):.*$", re.MULTILINE)
+
+
+class SemanticCachedLLMClient(_WrappingLLMClient):
+    """
+    Serve near-duplicate prompts (cosine similarity >= threshold with the same params) from earlier
+    answers, using local sentence embeddings persisted under cache_dir.
+
+    Prompts for two different repositories share most of their text and easily cross the
+    threshold, so only prompts with identical scope_re lines (by default the repository name and
+    URL) can answer each other.
+    """
+
+    def __init__(
+        self,
+        inner: LLMClient,
+        cache_dir: Path,
+        model_name: str = "all-MiniLM-L6-v2",
+        threshold: float = 0.92,
+        scope_re: "re.Pattern[str]" = _REPO_SCOPE_RE,
+    ):
+        try:
+            import numpy as np
+            from sentence_transformers import SentenceTransformer
+        except Exception as e:
+            raise RuntimeError("Semantic cache needs sentence-transformers. pip install sentence-transformers") from e
+        self._np = np
+        self._encoder = SentenceTransformer(model_name)
+        self.inner = inner
+        self.threshold = threshold
+        self.scope_re = scope_re
+        self.cache_dir = Path(cache_dir)
+        self._vectors_path = self.cache_dir / "semantic_vectors.npy"
+        self._entries_path = self.cache_dir / "semantic_entries.json"
+        # Flat inner-product search over normalized vectors; a few hundred READMEs need no ANN index.
+        self._vectors = np.zeros((0, self._encoder.get_sentence_embedding_dimension()), dtype=np.float32)
+        self._entries = []  # [{"params": ..., "response": ...}] aligned with self._vectors rows
+        if self._vectors_path.exists() and self._entries_path.exists():
+            self._vectors = np.load(self._vectors_path)
+            self._entries = json.loads(self._entries_path.read_text(encoding="utf8"))
+
+    def _params(self, prompt: str, kwargs: dict) -> str:
+        scope = [line.strip() for line in self.scope_re.findall(prompt)]
+        return json.dumps({"model": self.model, "scope": scope, "kwargs": kwargs}, sort_keys=True, default=str)
+
+    def _matches(self, q, params: str) -> Iterator[int]:
+        """
+        Indices of entries with the same params (and scope) within the threshold, most similar first.
+        """
+        if not len(self._entries):
+            return
+        scores = self._vectors @ q
+        for i in self._np.argsort(-scores):
+            if scores[i] < self.threshold:
+                break
+            if self._entries[i]["params"] == params:
+                yield int(i)
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        params = self._params(prompt, kwargs)
+        q = self._encoder.encode(prompt, normalize_embeddings=True).astype(self._np.float32)
+        for i in self._matches(q, params):
+            return self._entries[i]["response"]
+        text = self.inner.generate(prompt, **kwargs)
+        self._vectors = self._np.vstack([self._vectors, q[None, :]])
+        self._entries.append({"params": params, "response": text})
+        self._save()
+        return text
+
+    def _save(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_vectors = self._vectors_path.with_name(f"{self._vectors_path.name}.{os.getpid()}.tmp")
+        with open(tmp_vectors, "wb") as f:
+            self._np.save(f, self._vectors)
+        tmp_entries = self._entries_path.with_name(f"{self._entries_path.name}.{os.getpid()}.tmp")
+        tmp_entries.write_text(json.dumps(self._entries), encoding="utf8")
+        os.replace(tmp_vectors, self._vectors_path)
+        os.replace(tmp_entries, self._entries_path)
+
+    def forget(self, prompt: str, **kwargs) -> None:
+        # every entry that could answer this prompt, not only an exact match
+        q = self._encoder.encode(prompt, normalize_embeddings=True).astype(self._np.float32)
+        drop = set(self._matches(q, self._params(prompt, kwargs)))
+        if drop:
+            keep = [i for i in range(len(self._entries)) if i not in drop]
+            self._vectors = self._vectors[keep]
+            self._entries = [self._entries[i] for i in keep]
+            self._save()
+        self.inner.forget(prompt, **kwargs)
+
+
+class _AsyncFanOut:
+    """
+    generate_many()/generate_many_sync() on top of a subclass's agenerate() and _new_async_client().
+    Async HTTP clients are bound to the event loop they were first used in, so one is made per loop.
+    """
+
+    max_concurrency = 10
+    _aclient = None
+    _aclient_loop = None
+    _semaphore = None
+
+    def _new_async_client(self):
+        raise NotImplementedError
+
+    async def _close_async_client(self, client) -> None:
+        raise NotImplementedError
+
+    def _async_client(self):
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = self._new_async_client()
+            self._aclient_loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._aclient
+
+    async def agenerate(self, prompt: str, max_tokens: int = 512, **kwargs) -> str:
+        raise NotImplementedError
+
+    async def generate_many(self, prompts: List[str], max_tokens: int = 512, **kwargs) -> List[str]:
+        # create every task before awaiting any, so the requests are in flight together
+        return await asyncio.gather(*(self.agenerate(p, max_tokens, **kwargs) for p in prompts))
+
+    def generate_many_sync(self, prompts: List[str], max_tokens: int = 512, **kwargs) -> List[str]:
+        async def run():
+            try:
+                return await self.generate_many(prompts, max_tokens, **kwargs)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
+
+    async def aclose(self) -> None:
+        if self._aclient is not None:
+            await self._close_async_client(self._aclient)
+            self._aclient = None
 
 
 class OpenAIClient(LLMClient):
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini", max_retries: int = 3, timeout: float = 30.0):
         try:
             import openai
         except Exception as e:
             raise RuntimeError("OpenAI package not installed. pip install openai") from e
         self._openai = openai
-        self._openai.api_key = api_key
+        self._api_key = api_key
+        self.max_retries = max_retries
+        self.timeout = timeout
+        # one SDK client per instance: its internal httpx pool keeps the connection alive across calls
+        self._client = openai.OpenAI(api_key=api_key, max_retries=max_retries, timeout=timeout)
         self.model = model
 
-    def generate(self, prompt: str, max_tokens:int=512, **kwargs) -> str:
-        resp = self._openai.Completion.create(
+    def _messages(self, prompt: str, kwargs: dict) -> list:
+        system_prompt = kwargs.pop("system_prompt", None)
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+        return messages
+
+    def warmup(self) -> None:
+        # a cheap GET that leaves a TLS connection in the client's pool; the copy shares that pool
+        self._client.with_options(timeout=WARMUP_TIMEOUT, max_retries=0).models.list()
+
+    def generate(self, prompt: str, max_tokens: int = 512, **kwargs) -> str:
+        """
+        Stream a chat completion and return the joined text.
+        """
+        kwargs.setdefault("temperature", 0.2)
+        stream = self._client.chat.completions.create(
             model=self.model,
-            prompt=prompt,
+            messages=self._messages(prompt, kwargs),
             max_tokens=max_tokens,
-            temperature=0.2,
+            stream=True,
             **kwargs
         )
-        # There are different response shapes depending on API version; this is simplistic:
-        if "choices" in resp and len(resp.choices)>0:
-            return resp.choices[0].text.strip()
-        return str(resp)
+        parts = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            parts.append(chunk.choices[0].delta.content or "")
+        return "".join(parts).strip()
+
+
+class AsyncOpenAIClient(_AsyncFanOut, OpenAIClient):
+    """
+    OpenAIClient with an asyncio API (AsyncOpenAI) for issuing several prompts concurrently.
+    """
+
+    def __init__(self, *args, max_concurrency: int = 10, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_concurrency = max_concurrency
+
+    def _new_async_client(self):
+        return self._openai.AsyncOpenAI(api_key=self._api_key, max_retries=self.max_retries, timeout=self.timeout)
+
+    async def _close_async_client(self, client) -> None:
+        await client.close()
+
+    async def agenerate(self, prompt: str, max_tokens: int = 512, **kwargs) -> str:
+        client = self._async_client()
+        kwargs.setdefault("temperature", 0.2)
+        async with self._semaphore:
+            resp = await client.chat.completions.create(
+                model=self.model,
+                messages=self._messages(prompt, kwargs),
+                max_tokens=max_tokens,
+                **kwargs
+            )
+        return (resp.choices[0].message.content or "").strip()
 
 
 class DeepSeekClient(LLMClient):
@@ -50,39 +473,73 @@ class DeepSeekClient(LLMClient):
         api_key: str,
         model: str = "gpt-4o-mini",
         base_url: str = "https://openrouter.ai/api/v1",
+        connect_timeout: float = 5.0,
+        read_timeout: float = 120.0,
     ):
         self.api_key = api_key
         self.model = model
         self.base_url = base_url.rstrip("/")
         self.chat_endpoint = f"{self.base_url}/chat/completions"
+        # a hung provider must fail fast instead of blocking the caller (and its pool slot) forever;
+        # the read timeout bounds the wait between bytes, not the whole streamed generation
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.timeout = (connect_timeout, read_timeout)
+        # One keep-alive session per client: repeated calls reuse the TCP+TLS connection.
+        self._session = requests.Session()
+        self._session.headers.update(self._auth_headers())
+        # Transient provider errors are retried with exponential backoff, honouring Retry-After on 429/503.
+        # raise_on_status=False hands the final failed response back so generate() can report it.
+        # read=False: a POST that timed out after being sent may still be generating (and billed),
+        # so read errors are raised instead of re-sending it.
+        retry = Retry(
+            total=5,
+            read=False,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["HEAD", "GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
-    def generate(self, prompt: str, max_tokens: int = 512, **kwargs) -> str:
-        import requests
-
-        headers = {
+    def _auth_headers(self) -> Dict[str, str]:
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+
+    def warmup(self) -> None:
+        # Opens a connection in the session's pool; the status of the answer does not matter.
+        # Goes to the adapter's pool manager directly to bypass the session's retry policy.
+        pool_manager = self._session.get_adapter(self.base_url).poolmanager
+        pool_manager.request("HEAD", self.base_url, retries=False, timeout=WARMUP_TIMEOUT)
+
+    def close(self) -> None:
+        self._session.close()
+
+    def __del__(self):
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
+    def _payload(self, prompt: str, max_tokens: int, kwargs: dict) -> dict:
+        kwargs = dict(kwargs)
         messages = [
-            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "system", "content": kwargs.pop("system_prompt", None) or DEFAULT_SYSTEM_PROMPT},
             {"role": "user", "content": prompt},
         ]
-        data = {
+        return {
             "model": self.model,
             "messages": messages,
             "max_tokens": max_tokens,
             **kwargs,
         }
 
-        resp = requests.post(self.chat_endpoint, headers=headers, json=data)
-        try:
-            resp.raise_for_status()
-        except Exception as e:
-            raise RuntimeError(
-                f"OpenRouter DeepSeek API error: {resp.status_code} {resp.text}"
-            ) from e
-
-        resp_json = resp.json()
+    @staticmethod
+    def _parse_response(resp_json: dict) -> str:
         if "choices" in resp_json and len(resp_json["choices"]) > 0:
             first = resp_json["choices"][0]
             if "message" in first and "content" in first["message"]:
@@ -90,4 +547,119 @@ class DeepSeekClient(LLMClient):
             elif "text" in first:
                 return first["text"].strip()
         raise RuntimeError(f"Unexpected response format from OpenRouter: {resp_json}")
-    
\ No newline at end of file
+
+    def generate(self, prompt: str, max_tokens: int = 512, **kwargs) -> str:
+        """
+        Streamed completion joined into one string; use generate_stream() to consume the chunks.
+        """
+        return "".join(self.generate_stream(prompt, max_tokens, **kwargs)).strip()
+
+    def generate_stream(self, prompt: str, max_tokens: int = 512, **kwargs) -> Iterator[str]:
+        """
+        Yield content chunks as the server-sent events arrive instead of waiting for the full body.
+        Raises LLMTimeoutError when connecting or waiting for data exceeds the timeouts.
+        """
+        try:
+            yield from self._stream(prompt, max_tokens, kwargs)
+        except requests.exceptions.Timeout as e:
+            raise LLMTimeoutError(f"OpenRouter DeepSeek API timed out: {e}") from e
+        except requests.exceptions.ConnectionError as e:
+            if self._is_timeout(e):
+                raise LLMTimeoutError(f"OpenRouter DeepSeek API timed out: {e}") from e
+            raise
+
+    @staticmethod
+    def _is_timeout(e: requests.exceptions.ConnectionError) -> bool:
+        # A read timeout while consuming the body surfaces as ConnectionError(ReadTimeoutError),
+        # and one that exhausted the retries as ConnectionError(MaxRetryError(reason=...)).
+        cause = e.args[0] if e.args else None
+        if isinstance(cause, MaxRetryError):
+            cause = cause.reason
+        # NewConnectionError (refused, DNS failure) subclasses ConnectTimeoutError in urllib3 2.x;
+        # like requests.adapters, do not report it as a timeout
+        return isinstance(cause, ReadTimeoutError) or (
+            isinstance(cause, ConnectTimeoutError) and not isinstance(cause, NewConnectionError)
+        )
+
+    def _stream(self, prompt: str, max_tokens: int, kwargs: dict) -> Iterator[str]:
+        data = self._payload(prompt, max_tokens, kwargs)
+        data["stream"] = True
+
+        # serialized here (Content-Type is set on the session) to skip requests' stdlib json pass
+        body = _json_dumps(data)
+        with self._session.post(self.chat_endpoint, data=body, timeout=self.timeout, stream=True) as resp:
+            try:
+                resp.raise_for_status()
+            except Exception as e:
+                raise RuntimeError(
+                    f"OpenRouter DeepSeek API error: {resp.status_code} {resp.text}"
+                ) from e
+
+            if "text/event-stream" not in resp.headers.get("Content-Type", ""):
+                # provider ignored stream=True and answered with a plain JSON body
+                yield self._parse_response(_json_loads(resp.content))
+                return
+
+            # same read size as iter_lines(), whose line splitting is not safe for SSE
+            for line in _iter_sse_lines(resp.iter_content(chunk_size=512)):
+                # blank lines separate events; lines starting with ":" are keep-alive comments
+                if not line or not line.startswith("data:"):
+                    continue
+                payload = line[len("data:"):].strip()
+                if payload == "[DONE]":
+                    break
+                chunk = _json_loads(payload)
+                if "error" in chunk:
+                    raise RuntimeError(f"OpenRouter DeepSeek API error: {chunk['error']}")
+                choices = chunk.get("choices") or []
+                text = (choices[0].get("delta") or {}).get("content") if choices else None
+                if text:
+                    yield text
+
+
+class AsyncDeepSeekClient(_AsyncFanOut, DeepSeekClient):
+    """
+    DeepSeekClient with an asyncio API for issuing several prompts concurrently over httpx.
+    Synchronous generate() is inherited and keeps using the requests session.
+    """
+
+    def __init__(self, *args, max_concurrency: int = 10, **kwargs):
+        super().__init__(*args, **kwargs)
+        try:
+            import httpx
+        except Exception as e:
+            raise RuntimeError("httpx package not installed. pip install httpx") from e
+        self._httpx = httpx
+        self.max_concurrency = max_concurrency
+        # HTTP/2 multiplexes the concurrent requests over one connection when h2 is available
+        self._http2 = importlib.util.find_spec("h2") is not None
+
+    def _new_async_client(self):
+        return self._httpx.AsyncClient(
+            # not the session's headers: requests' defaults include Connection: keep-alive,
+            # a connection-specific header that HTTP/2 forbids
+            headers=self._auth_headers(),
+            http2=self._http2,
+            limits=self._httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=self._httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+        )
+
+    async def _close_async_client(self, client) -> None:
+        await client.aclose()
+
+    async def agenerate(self, prompt: str, max_tokens: int = 512, **kwargs) -> str:
+        client = self._async_client()
+        data = self._payload(prompt, max_tokens, kwargs)
+        # cap in-flight requests so a large fan-out does not trip provider rate limits
+        async with self._semaphore:
+            try:
+                resp = await client.post(self.chat_endpoint, content=_json_dumps(data))
+            except self._httpx.TimeoutException as e:
+                raise LLMTimeoutError(f"OpenRouter DeepSeek API timed out: {e}") from e
+        try:
+            resp.raise_for_status()
+        except Exception as e:
+            raise RuntimeError(
+                f"OpenRouter DeepSeek API error: {resp.status_code} {resp.text}"
+            ) from e
+        return self._parse_response(_json_loads(resp.content))
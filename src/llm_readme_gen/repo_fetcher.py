@@ -1,7 +1,11 @@
+import os
 import shutil
 import subprocess
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from .config import Config
+from .llm_client import CACHE_DIR_NAME
 
 
 class RepoFetcher:
@@ -14,10 +18,15 @@ class RepoFetcher:
         self.work_dir = Path(cfg.work_dir).absolute()
 
     def prepare(self) -> Path:
-        """Ensure work_dir exists and is empty."""
-        if self.work_dir.exists():
-            shutil.rmtree(self.work_dir)
+        """Ensure work_dir exists and is empty, except for the LLM response cache."""
         self.work_dir.mkdir(parents=True, exist_ok=True)
+        for child in self.work_dir.iterdir():
+            if child.name == CACHE_DIR_NAME:
+                continue
+            if child.is_dir() and not child.is_symlink():
+                shutil.rmtree(child)
+            else:
+                child.unlink()
         return self.work_dir
 
     def fetch(self) -> Path:
@@ -29,13 +38,92 @@ class RepoFetcher:
         addr = self.cfg.repo_address
         repo_root = self.prepare() / "repo"
         if addr.startswith(("http://", "https://", "git@")):
-            cmd = ["git", "clone", "--depth", "1", addr, str(repo_root)]
-            subprocess.run(cmd, check=True)
+            # protocol v2 lets the server filter refs; only the default branch tip is transferred
+            cmd = [
+                "git", "-c", "protocol.version=2", "clone",
+                "--depth", "1", "--single-branch", "--no-tags",
+                addr, str(repo_root),
+            ]
+            # fail instead of hanging on a credential prompt
+            env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+            # smart HTTP has no upload-archive service, so only ssh remotes can serve an archive
+            if addr.startswith("git@") and self._fetch_archive(addr, repo_root, env):
+                return repo_root
+            subprocess.run(cmd, check=True, env=env)
+            # the analyzer only needs the working tree, not the pack files and refs
+            shutil.rmtree(repo_root / ".git", ignore_errors=True)
             return repo_root
         else:
             local = Path(addr).expanduser()
             if not local.exists():
                 raise FileNotFoundError(f"Local path {local} does not exist")
-            # copy contents to repo_root to avoid changing user files
-            shutil.copytree(local, repo_root)
+            if self.cfg.read_only:
+                # the analyzer only reads, so the user's tree can be used as is
+                return local
+            # copy contents to repo_root to avoid changing user files; hardlinks make the
+            # "copy" a metadata-only operation where the filesystem allows it
+            if self.cfg.fast_copy:
+                _parallel_copytree(local, repo_root)
+            else:
+                # symlinks=True: recreate links like _parallel_copytree, so both modes see one tree
+                shutil.copytree(local, repo_root, symlinks=True, copy_function=_link_or_copy)
             return repo_root
+
+
+    def _fetch_archive(self, addr: str, repo_root: Path, env: dict) -> bool:
+        """
+        Extract `git archive --remote` of HEAD straight into repo_root: a snapshot without .git
+        or a checkout step. Returns False (leaving no repo_root behind) if the remote refuses.
+        """
+        if not hasattr(tarfile, "data_filter"):
+            return False  # this Python can't extract untrusted archives safely
+        cmd = ["git", "archive", "--remote", addr, "--format=tar", "HEAD"]
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env)
+        ok = False
+        try:
+            # stream mode: members are extracted as the bytes arrive, nothing is buffered whole
+            with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+                tar.extractall(repo_root, filter="data")
+            ok = True
+        except tarfile.TarError:
+            pass
+        finally:
+            proc.stdout.close()
+            ok = proc.wait() == 0 and ok
+        if not ok:
+            shutil.rmtree(repo_root, ignore_errors=True)
+        return ok
+
+
+def _parallel_copytree(src: Path, dst: Path, workers: int = 16) -> None:
+    """
+    Copy src to dst, creating directories serially and copying files on a thread pool:
+    per-file copies are syscall-bound and release the GIL. Symlinks are recreated, not followed.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for dirpath, dirnames, filenames in os.walk(src):
+            target = os.path.join(dst, os.path.relpath(dirpath, src))
+            os.makedirs(target, exist_ok=True)
+            # os.walk does not descend into symlinked directories; they only need recreating
+            for name in dirnames:
+                s = os.path.join(dirpath, name)
+                if os.path.islink(s):
+                    os.symlink(os.readlink(s), os.path.join(target, name))
+            for name in filenames:
+                s, d = os.path.join(dirpath, name), os.path.join(target, name)
+                if os.path.islink(s):
+                    os.symlink(os.readlink(s), d)
+                else:
+                    futures.append(pool.submit(_link_or_copy, s, d))
+        # surface the first failure, if any
+        for f in futures:
+            f.result()
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        # different filesystem, or links not supported
+        shutil.copy2(src, dst)
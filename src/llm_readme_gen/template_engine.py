@@ -1,15 +1,33 @@
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import functools
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator
+
+
+@functools.lru_cache(maxsize=8)
+def _make_env(template_dir: str) -> Environment:
+    # one Environment per template dir and process, so its template cache is shared by all engines
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(enabled_extensions=("html",)),
+        # compiled templates persist across runs in jinja's private per-user temp dir,
+        # so later processes skip lexing/parsing; invalidated when the source changes
+        bytecode_cache=FileSystemBytecodeCache(pattern="llm_readme_gen_%s.cache"),
+        cache_size=-1,
+        # templates don't change while the tool runs: skip the mtime check on every get_template()
+        auto_reload=False,
+    )
 
 
 class TemplateEngine:
     def __init__(self, template_dir: Path):
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=select_autoescape(enabled_extensions=("html",))
-        )
+        self.env = _make_env(str(Path(template_dir).resolve()))
 
     def render(self, template_name: str, context: Dict) -> str:
         tpl = self.env.get_template(template_name)
         return tpl.render(**context)
+
+    def stream(self, template_name: str, context: Dict) -> Iterator[str]:
+        """Yield the rendered template in chunks instead of building the whole string."""
+        tpl = self.env.get_template(template_name)
+        return tpl.generate(**context)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from llm_readme_gen.analyzer import RepoAnalyzer
 
@@ -14,3 +15,78 @@ def test_analyzer_on_simple_repo(tmp_path):
     assert "Python" in meta.languages
     assert meta.license == "MIT"
     assert "requirements.txt" in meta.dependencies.get("python", [])
+
+
+def test_analyzer_walks_nested_dirs(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "pkg" / "sub").mkdir(parents=True)
+    (repo / "pkg" / "sub" / "big.js").write_text("x" * 100)
+    (repo / "pkg" / "util_test.go").write_text("package pkg")
+    (repo / "small.py").write_text("pass")
+    meta = RepoAnalyzer(repo).analyze()
+    assert meta.languages == {"JavaScript": 1, "Go": 1, "Python": 1}
+    assert meta.top_files[0] == str(Path("pkg") / "sub" / "big.js")
+    assert "pkg" not in meta.top_files
+    assert meta.has_tests
+
+
+def test_detect_tests_standalone(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("pass")
+    assert not RepoAnalyzer(tmp_path)._detect_tests()
+    (tmp_path / "src" / "test_app.py").write_text("pass")
+    assert RepoAnalyzer(tmp_path)._detect_tests()
+
+
+def test_license_detection_does_not_match_mit_substring(tmp_path):
+    (tmp_path / "LICENSE").write_text("GPL v3\nEveryone is permitted to copy and distribute verbatim copies")
+    assert RepoAnalyzer(tmp_path)._detect_license() == "GPL"
+
+
+def test_languages_ordered_by_file_count(tmp_path):
+    (tmp_path / "a.js").write_text("")
+    for name in ("b.py", "c.py"):
+        (tmp_path / name).write_text("")
+    assert list(RepoAnalyzer(tmp_path).analyze().languages) == ["Python", "JavaScript"]
+
+
+def test_license_detection_prefers_title_marker(tmp_path):
+    (tmp_path / "LICENSE").write_text(
+        "GNU LESSER GENERAL PUBLIC LICENSE\nThis version of the GNU Lesser General Public License "
+        "incorporates the terms of version 3 of the GNU General Public License"
+    )
+    assert RepoAnalyzer(tmp_path)._detect_license() == "LGPL"
+
+
+def test_description_skips_markdown_title(tmp_path):
+    (tmp_path / "README.md").write_text("# demo\n\nA tiny demo project.\nMore text.\n")
+    assert RepoAnalyzer(tmp_path).analyze().description == "A tiny demo project."
+
+
+def test_analyzer_counts_only_regular_files(tmp_path):
+    (tmp_path / "realdir").mkdir()
+    (tmp_path / "realdir" / "f.txt").write_text("content")
+    (tmp_path / "a.py").write_text("pass")
+    (tmp_path / "linkdir").symlink_to(tmp_path / "realdir", target_is_directory=True)
+    (tmp_path / "broken.py").symlink_to(tmp_path / "missing.py")
+    meta = RepoAnalyzer(tmp_path).analyze()
+    assert meta.languages == {"Python": 1}
+    assert sorted(meta.top_files) == ["a.py", str(Path("realdir") / "f.txt")]
+
+
+def test_analyzer_skips_unreadable_subdirectories(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    (repo / "private").mkdir(parents=True)
+    (repo / "private" / "hidden.js").write_text("x")
+    (repo / "main.py").write_text("pass")
+    real_scandir = os.scandir
+
+    # chmod cannot lock out root, so deny the listing at the call instead
+    def scandir(path):
+        if os.path.basename(path) == "private":
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    meta = RepoAnalyzer(repo).analyze()
+    assert meta.languages == {"Python": 1}
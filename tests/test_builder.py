@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from llm_readme_gen.analyzer import RepoMetadata
+from llm_readme_gen.builder import ReadmeBuilder
+from llm_readme_gen.config import Config
+from llm_readme_gen.llm_client import CachedLLMClient, LLMClient, MemoryCacheBackend
+
+TEMPLATES = Path(__file__).parent.parent / "templates"
+
+
+class FakeLLM(LLMClient):
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def generate(self, prompt, **kwargs):
+        self.calls += 1
+        return self.response
+
+
+def _metadata():
+    return RepoMetadata(
+        name="demo", description="Demo repo", languages={"Python": 2}, top_files=["main.py"],
+        has_tests=False, dependencies={}, license=None, readme_exists=False,
+    )
+
+
+def test_llm_description_and_readme_use_one_call(tmp_path):
+    cfg = Config("demo", tmp_path / "README.md", tmp_path, use_llm=True)
+    llm = FakeLLM("```json\n" + json.dumps({"description": "Short", "readme": "# demo"}) + "\n```")
+    builder = ReadmeBuilder(cfg, llm=llm, template_dir=TEMPLATES)
+    meta = _metadata()
+    assert builder.build_context(meta)["description"] == "Short"
+    assert builder.render(meta, cfg.output_path) == "# demo"
+    assert llm.calls == 1
+
+
+def test_llm_non_json_response_is_used_as_readme(tmp_path):
+    cfg = Config("demo", tmp_path / "README.md", tmp_path, use_llm=True)
+    builder = ReadmeBuilder(cfg, llm=FakeLLM("# plain markdown"), template_dir=TEMPLATES)
+    assert builder.render(_metadata(), cfg.output_path) == "# plain markdown"
+    assert (tmp_path / "README.md").read_text() == "# plain markdown"
+
+
+# cut off by max_tokens in the middle of the readme string: inside a \u escape, and between
+# (or inside) the two halves of a surrogate pair
+@pytest.mark.parametrize("cut", ["\\u00", "\\ud83d", "\\ud83d\\", "\\ud83d\\ude"])
+def test_llm_truncated_envelope_is_salvaged_and_not_cached(tmp_path, cut):
+    cfg = Config("demo", tmp_path / "README.md", tmp_path, use_llm=True)
+    backend = MemoryCacheBackend()
+    llm = CachedLLMClient(FakeLLM('{"description": "Short", "readme": "# demo\\n\\nIntro \\ud83d\\ude80 ' + cut), backend)
+    builder = ReadmeBuilder(cfg, llm=llm, template_dir=TEMPLATES)
+    meta = _metadata()
+    assert builder.build_context(meta)["description"] == "Short"
+    assert builder.render(meta, cfg.output_path) == "# demo\n\nIntro \U0001f680 "
+    assert cfg.output_path.read_text(encoding="utf8") == "# demo\n\nIntro \U0001f680 "
+    assert backend._entries == {}
+
+
+def test_llm_unusable_json_falls_back_to_template(tmp_path):
+    cfg = Config("demo", tmp_path / "README.md", tmp_path, use_llm=True)
+    builder = ReadmeBuilder(cfg, llm=FakeLLM('{"descrip'), template_dir=TEMPLATES)
+    content = builder.render(_metadata(), cfg.output_path)
+    assert "demo" in content and not content.startswith("{")
@@ -0,0 +1,162 @@
+import http.server
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from llm_readme_gen.llm_client import (
+    CachedLLMClient, DeepSeekClient, DiskCacheBackend, LLMClient, LLMTimeoutError, MemoizingLLMClient,
+)
+
+
+class CountingLLM(LLMClient):
+    model = "fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, prompt, **kwargs):
+        self.calls += 1
+        return f"answer {self.calls}"
+
+
+def test_cached_client_persists_responses(tmp_path):
+    inner = CountingLLM()
+    assert CachedLLMClient(inner, DiskCacheBackend(tmp_path)).generate("hi", max_tokens=10) == "answer 1"
+    # a fresh backend over the same directory reuses the stored answer
+    assert CachedLLMClient(inner, DiskCacheBackend(tmp_path)).generate("hi", max_tokens=10) == "answer 1"
+    assert CachedLLMClient(inner, DiskCacheBackend(tmp_path)).generate("hi", max_tokens=20) == "answer 2"
+    assert inner.calls == 2
+
+
+def test_disk_cache_entries_expire(tmp_path):
+    backend = DiskCacheBackend(tmp_path, ttl=60)
+    backend.set("k", "v")
+    old = os.stat(tmp_path / "k.txt").st_mtime - 120
+    os.utime(tmp_path / "k.txt", (old, old))
+    assert DiskCacheBackend(tmp_path, ttl=60).get("k") is None
+    assert DiskCacheBackend(tmp_path, ttl=None).get("k") == "v"
+
+
+def test_memoizing_client_evicts_least_recently_used():
+    inner = CountingLLM()
+    llm = MemoizingLLMClient(inner, maxsize=2)
+    assert llm.generate("a") == "answer 1"
+    assert llm.generate("b") == "answer 2"
+    assert llm.generate("a") == "answer 1"
+    llm.generate("c")  # evicts "b"
+    assert llm.generate("b") == "answer 4"
+    assert inner.calls == 4
+
+
+def test_cache_key_follows_the_model_through_wrappers(tmp_path):
+    # two runs with different models sharing one cache directory
+    first, second = CountingLLM(), CountingLLM()
+    second.model = "other"
+    for inner in (first, second):
+        llm = MemoizingLLMClient(CachedLLMClient(MemoizingLLMClient(inner), DiskCacheBackend(tmp_path)))
+        assert llm.model == inner.model
+        assert llm.generate("hi") == "answer 1"
+    assert first.calls == second.calls == 1
+
+
+@pytest.fixture
+def provider():
+    """
+    Local HTTP server answering every POST with the (content_type, body) in replies.
+    Yields (base_url, replies).
+    """
+    replies = {}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            content_type, body = replies["reply"]
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/api/v1", replies
+    server.shutdown()
+    server.server_close()
+
+
+def _sse(*events):
+    return "".join(f"data: {e}\r\n\r\n" for e in events).encode("utf8")
+
+
+def _delta(text):
+    return json.dumps({"choices": [{"delta": {"content": text}}]}, ensure_ascii=False)
+
+
+def test_deepseek_stream_stops_at_done_and_skips_comments(provider):
+    base_url, replies = provider
+    body = b": keep-alive\n\n" + _sse(_delta("Hello"), _delta(" world"), "[DONE]", _delta("ignored"))
+    replies["reply"] = ("text/event-stream", body)
+    assert DeepSeekClient("k", base_url=base_url).generate("hi") == "Hello world"
+
+
+def test_deepseek_stream_keeps_unicode_line_separators_in_payload(provider):
+    base_url, replies = provider
+    replies["reply"] = ("text/event-stream", _sse(_delta("a\u2028b\u2029c\u0085d"), "[DONE]"))
+    assert list(DeepSeekClient("k", base_url=base_url).generate_stream("hi")) == ["a\u2028b\u2029c\u0085d"]
+
+
+def test_deepseek_stream_raises_on_in_stream_error(provider):
+    base_url, replies = provider
+    replies["reply"] = ("text/event-stream", _sse(_delta("partial"), json.dumps({"error": {"message": "overloaded"}})))
+    with pytest.raises(RuntimeError, match="overloaded"):
+        DeepSeekClient("k", base_url=base_url).generate("hi")
+
+
+def test_deepseek_falls_back_to_json_body(provider):
+    base_url, replies = provider
+    body = json.dumps({"choices": [{"message": {"content": " full answer "}}]}).encode("utf8")
+    replies["reply"] = ("application/json", body)
+    assert DeepSeekClient("k", base_url=base_url).generate("hi") == "full answer"
+
+
+def test_deepseek_hung_provider_raises_timeout_quickly():
+    # accepts connections (the kernel completes the handshake) but never answers
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(8)
+    try:
+        llm = DeepSeekClient("k", base_url=f"http://127.0.0.1:{listener.getsockname()[1]}", read_timeout=0.2)
+        started = time.monotonic()
+        with pytest.raises(LLMTimeoutError):
+            llm.generate("hi")
+        assert time.monotonic() - started < 2
+    finally:
+        listener.close()
+
+
+def test_deepseek_refused_connection_is_not_a_timeout():
+    # bind a port, then close it: connecting is refused immediately
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    llm = DeepSeekClient("k", base_url=f"http://127.0.0.1:{port}")
+    # one attempt, still wrapped in MaxRetryError as when the retries run out
+    llm._session.mount("http://", HTTPAdapter(max_retries=Retry(total=0, read=False)))
+    with pytest.raises(requests.exceptions.ConnectionError) as excinfo:
+        llm.generate("hi")
+    assert not isinstance(excinfo.value, LLMTimeoutError)
+    assert isinstance(excinfo.value.args[0], MaxRetryError)
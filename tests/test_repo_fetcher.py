@@ -0,0 +1,69 @@
+import os
+import shutil
+
+import pytest
+
+from llm_readme_gen.analyzer import RepoAnalyzer
+from llm_readme_gen.config import Config
+from llm_readme_gen.repo_fetcher import RepoFetcher, _parallel_copytree
+
+
+def _source(tmp_path):
+    src = tmp_path / "src"
+    (src / "pkg").mkdir(parents=True)
+    (src / "pkg" / "mod.py").write_text("pass")
+    (src / "main.py").write_text("print('hi')")
+    os.symlink("pkg", src / "linked_pkg")
+    os.symlink("missing.py", src / "dangling.py")
+    return src
+
+
+def _fetch(tmp_path, src, fast_copy):
+    work_dir = tmp_path / ("fast" if fast_copy else "serial")
+    cfg = Config(str(src), tmp_path / "README.md", work_dir, use_llm=False, fast_copy=fast_copy)
+    return RepoFetcher(cfg).fetch()
+
+
+@pytest.mark.parametrize("fast_copy", [True, False])
+def test_local_copy_hardlinks_files_and_recreates_symlinks(tmp_path, fast_copy):
+    src = _source(tmp_path)
+    repo = _fetch(tmp_path, src, fast_copy)
+    assert os.path.samefile(repo / "pkg" / "mod.py", src / "pkg" / "mod.py")
+    assert os.readlink(repo / "linked_pkg") == "pkg"
+    assert os.readlink(repo / "dangling.py") == "missing.py"
+
+
+def test_copy_modes_produce_the_same_analysis(tmp_path):
+    src = _source(tmp_path)
+    fast = RepoAnalyzer(_fetch(tmp_path, src, fast_copy=True)).analyze()
+    serial = RepoAnalyzer(_fetch(tmp_path, src, fast_copy=False)).analyze()
+    assert fast.languages == serial.languages == {"Python": 2}
+    assert fast.top_files == serial.top_files
+
+
+def test_copy_falls_back_when_hardlinks_fail(tmp_path, monkeypatch):
+    src = _source(tmp_path)
+
+    def no_link(src, dst):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(os, "link", no_link)
+    dst = tmp_path / "dst"
+    _parallel_copytree(src, dst)
+    assert (dst / "pkg" / "mod.py").read_text() == "pass"
+    assert not os.path.samefile(dst / "pkg" / "mod.py", src / "pkg" / "mod.py")
+
+
+def test_parallel_copy_raises_the_copy_error(tmp_path, monkeypatch):
+    src = _source(tmp_path)
+
+    def no_link(src, dst):
+        raise OSError("cross-device link")
+
+    def no_copy(src, dst):
+        raise PermissionError(f"cannot copy {src}")
+
+    monkeypatch.setattr(os, "link", no_link)
+    monkeypatch.setattr(shutil, "copy2", no_copy)
+    with pytest.raises(PermissionError, match="cannot copy"):
+        _parallel_copytree(src, tmp_path / "dst")
@@ -0,0 +1,14 @@
+from pathlib import Path
+from llm_readme_gen.template_engine import TemplateEngine
+
+TEMPLATES = Path(__file__).parent.parent / "templates"
+
+
+def test_stream_matches_render():
+    ctx = {
+        "name": "demo", "description": "Demo", "languages": {"Python": 1}, "top_files": ["main.py"],
+        "has_tests": True, "dependencies": {"python": ["requirements.txt"]}, "license": "MIT",
+        "usage": "python main.py",
+    }
+    engine = TemplateEngine(TEMPLATES)
+    assert "".join(engine.stream("readme.md.jinja", ctx)) == engine.render("readme.md.jinja", ctx)